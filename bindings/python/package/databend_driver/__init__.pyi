@@ -95,7 +95,7 @@ class AsyncDatabendConnection:
     async def query_row(self, sql: str, params: Any = None) -> Row: ...
     async def query_all(self, sql: str, params: Any = None) -> list[Row]: ...
     async def query_iter(self, sql: str, params: Any = None) -> RowIterator: ...
-    async def stream_load(self, sql: str, data: list[list[str]]) -> ServerStats: ...
+    async def stream_load(self, sql: str, data: list[list[Any]]) -> ServerStats: ...
     async def load_file(
         self, sql: str, file: str, format_option: dict, copy_options: dict = None
     ) -> ServerStats: ...
@@ -115,7 +115,7 @@ class BlockingDatabendConnection:
     def query_row(self, sql: str, params: Any = None) -> Row: ...
     def query_all(self, sql: str, params: Any = None) -> list[Row]: ...
     def query_iter(self, sql: str, params: Any = None) -> RowIterator: ...
-    def stream_load(self, sql: str, data: list[list[str]]) -> ServerStats: ...
+    def stream_load(self, sql: str, data: list[list[Any]]) -> ServerStats: ...
     def load_file(
         self, sql: str, file: str, format_option: dict, copy_options: dict = None
     ) -> ServerStats: ...
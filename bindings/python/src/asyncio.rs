@@ -18,7 +18,7 @@ use std::sync::Arc;
 
 use crate::{
     types::{ConnectionInfo, DriverError, Row, RowIterator, ServerStats, VERSION},
-    utils::to_sql_params,
+    utils::{to_csv_strings, to_sql_params},
 };
 use databend_driver::LoadMethod;
 use pyo3::prelude::*;
@@ -198,15 +198,19 @@ impl AsyncDatabendConnection {
         })
     }
 
+    /// Rows may contain any cell values accepted by the cursor API (str,
+    /// bool, int, float, None, dict, ...); conversion to CSV happens here
+    /// in Rust instead of requiring pre-stringified cells.
     #[pyo3(signature = (sql, data, method=None))]
     pub fn stream_load<'p>(
         &'p self,
         py: Python<'p>,
         sql: String,
-        data: Vec<Vec<String>>,
+        data: Vec<Bound<'p, PyAny>>,
         method: Option<String>,
     ) -> PyResult<Bound<'p, PyAny>> {
         let this = self.0.clone();
+        let data = to_csv_strings(data)?;
         future_into_py(py, async move {
             let load_method = LoadMethod::from_str(&method.unwrap_or_else(|| "stage".to_string()))
                 .map_err(DriverError::new)?;
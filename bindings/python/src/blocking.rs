@@ -18,7 +18,7 @@ use std::str::FromStr;
 use std::sync::Arc;
 
 use crate::types::{ConnectionInfo, DriverError, Row, RowIterator, ServerStats, VERSION};
-use crate::utils::{options_as_ref, to_sql_params, wait_for_future};
+use crate::utils::{options_as_ref, to_csv_strings, to_sql_params, wait_for_future};
 use databend_driver::{LoadMethod, SchemaRef};
 use pyo3::exceptions::{PyAttributeError, PyException, PyStopIteration};
 use pyo3::types::{PyList, PyTuple};
@@ -171,15 +171,19 @@ impl BlockingDatabendConnection {
         Ok(RowIterator::new(it))
     }
 
+    /// Rows may contain any cell values accepted by the cursor API (str,
+    /// bool, int, float, None, dict, ...); conversion to CSV happens here
+    /// in Rust instead of requiring pre-stringified cells.
     #[pyo3(signature = (sql, data, method=None))]
     pub fn stream_load(
         &self,
         py: Python,
         sql: String,
-        data: Vec<Vec<String>>,
+        data: Vec<Bound<PyAny>>,
         method: Option<String>,
     ) -> PyResult<ServerStats> {
         let this = self.0.clone();
+        let data = to_csv_strings(data)?;
         let ret = wait_for_future(py, async move {
             let load_method = LoadMethod::from_str(&method.unwrap_or_else(|| "stage".to_string()))
                 .map_err(DriverError::new)?;
@@ -422,15 +426,25 @@ impl BlockingDatabendCursor {
         let mut result = self.buffer.drain(..).collect::<Vec<_>>();
         if let Some(ref rows) = self.rows {
             let size = size.unwrap_or(1);
-            while result.len() < size {
-                let row = wait_for_future(py, async move {
+            if result.len() < size {
+                // drain the whole batch inside one runtime entry instead of
+                // re-acquiring the lock and blocking per row
+                let need = size - result.len();
+                let fetched = wait_for_future(py, async move {
                     let mut rows = rows.lock().await;
-                    rows.next().await.transpose().map_err(DriverError::new)
-                })?;
-                if let Some(row) = row {
-                    result.push(Row::new(row));
-                } else {
-                    break;
+                    // cap the preallocation: `size` comes straight from Python
+                    // and may be huge (e.g. sys.maxsize)
+                    let mut fetched = Vec::with_capacity(need.min(16 * 1024));
+                    while fetched.len() < need {
+                        match rows.next().await {
+                            Some(row) => fetched.push(row),
+                            None => break,
+                        }
+                    }
+                    fetched
+                });
+                for row in fetched {
+                    result.push(Row::new(row.map_err(DriverError::new)?));
                 }
             }
         }
@@ -474,68 +488,3 @@ impl BlockingDatabendCursor {
         slf
     }
 }
-
-fn to_csv_strings(parameters: Vec<Bound<'_, PyAny>>) -> PyResult<Vec<Vec<String>>> {
-    let mut rows = Vec::with_capacity(parameters.len());
-    for row in parameters {
-        let iter = row.try_iter()?;
-        let row = iter
-            .map(|v| match v {
-                Ok(v) => to_csv_field(v),
-                Err(e) => Err(e),
-            })
-            .collect::<Result<Vec<_>, _>>()?;
-        rows.push(row);
-    }
-    Ok(rows)
-}
-
-fn to_csv_field(v: Bound<PyAny>) -> PyResult<String> {
-    if v.is_none() {
-        return Ok("".to_string());
-    }
-    match v.downcast::<PyAny>() {
-        Ok(v) => {
-            if let Ok(v) = v.extract::<String>() {
-                Ok(v)
-            } else if let Ok(v) = v.extract::<bool>() {
-                Ok(v.to_string())
-            } else if let Ok(v) = v.extract::<i64>() {
-                Ok(v.to_string())
-            } else if let Ok(v) = v.extract::<f64>() {
-                Ok(v.to_string())
-            } else {
-                // Try to convert dict-like objects to JSON string
-                if let Ok(dict) = v.downcast::<pyo3::types::PyDict>() {
-                    // Convert Python dict to JSON string
-                    let json_string = Python::with_gil(|py| {
-                        let json_module = py.import("json")?;
-                        let dumps = json_module.getattr("dumps")?;
-                        let result = dumps.call1((dict,))?;
-                        result.extract::<String>()
-                    })?;
-                    Ok(json_string)
-                } else {
-                    // Try to convert any object to string using its __str__ method
-                    match v.call_method0("__str__") {
-                        Ok(str_obj) => {
-                            if let Ok(s) = str_obj.extract::<String>() {
-                                Ok(s)
-                            } else {
-                                Err(PyAttributeError::new_err(format!(
-                                    "Failed to convert object to string: {v:?}"
-                                )))
-                            }
-                        }
-                        Err(_) => {
-                            Err(PyAttributeError::new_err(format!(
-                                "Invalid parameter type for: {v:?}, expected str, bool, int, float, dict, or object with __str__ method"
-                            )))
-                        }
-                    }
-                }
-            }
-        }
-        Err(e) => Err(e.into()),
-    }
-}
@@ -22,7 +22,7 @@ use chrono::{Duration, NaiveDate};
 use once_cell::sync::Lazy;
 use pyo3::exceptions::{PyAttributeError, PyException, PyStopAsyncIteration, PyStopIteration};
 use pyo3::sync::GILOnceCell;
-use pyo3::types::{PyBytes, PyDict, PyList, PyTuple, PyType};
+use pyo3::types::{PyBytes, PyDict, PyList, PyString, PyTuple, PyType};
 use pyo3::{intern, IntoPyObjectExt};
 use pyo3::{prelude::*, BoundObject};
 use pyo3_async_runtimes::tokio::future_into_py;
@@ -120,7 +120,16 @@ impl<'py> IntoPyObject<'py> for Value {
             databend_driver::Value::Map(inner) => {
                 let dict = PyDict::new(py);
                 for (k, v) in inner {
-                    dict.set_item(Value(k), Value(v)).unwrap();
+                    // map keys repeat across rows; interned strings are shared
+                    // and hash by pointer on lookup
+                    match k {
+                        databend_driver::Value::String(k) => {
+                            dict.set_item(PyString::intern(py, &k), Value(v)).unwrap();
+                        }
+                        _ => {
+                            dict.set_item(Value(k), Value(v)).unwrap();
+                        }
+                    }
                 }
                 dict.into_bound_py_any(py)?
             }
@@ -187,21 +196,11 @@ impl<'py> IntoPyObject<'py> for NumberValue {
             databend_driver::NumberValue::UInt64(i) => i.into_bound_py_any(py)?,
             databend_driver::NumberValue::Float32(i) => i.into_bound_py_any(py)?,
             databend_driver::NumberValue::Float64(i) => i.into_bound_py_any(py)?,
-            databend_driver::NumberValue::Decimal64(_, _) => {
-                let dec_cls = get_decimal_cls(py).expect("failed to load decimal.Decimal");
-                let ret = dec_cls
-                    .call1((self.0.to_string(),))
-                    .expect("failed to call decimal.Decimal(value)");
-                ret.into_bound()
-            }
-            databend_driver::NumberValue::Decimal128(_, _) => {
-                let dec_cls = get_decimal_cls(py).expect("failed to load decimal.Decimal");
-                let ret = dec_cls
-                    .call1((self.0.to_string(),))
-                    .expect("failed to call decimal.Decimal(value)");
-                ret.into_bound()
-            }
-            databend_driver::NumberValue::Decimal256(_, _) => {
+            databend_driver::NumberValue::Decimal64(_, _)
+            | databend_driver::NumberValue::Decimal128(_, _)
+            | databend_driver::NumberValue::Decimal256(_, _) => {
+                // decimal.Decimal parses the string in the C _decimal module;
+                // the class object itself is cached in DECIMAL_CLS
                 let dec_cls = get_decimal_cls(py).expect("failed to load decimal.Decimal");
                 let ret = dec_cls
                     .call1((self.0.to_string(),))
@@ -215,68 +214,89 @@ impl<'py> IntoPyObject<'py> for NumberValue {
 
 #[pyclass(module = "databend_driver")]
 pub struct Row {
-    inner: databend_driver::Row,
+    schema: databend_driver::SchemaRef,
+    // consumed by the first conversion; every accessor afterwards reads
+    // from the cached tuple so each cell is converted exactly once
+    inner: Option<databend_driver::Row>,
     idx: usize,
+    values: Option<Py<PyTuple>>,
 }
 
 impl Row {
     pub fn new(row: databend_driver::Row) -> Self {
-        Row { inner: row, idx: 0 }
+        Row {
+            schema: row.schema(),
+            inner: Some(row),
+            idx: 0,
+            values: None,
+        }
+    }
+
+    fn tuple<'p>(&'p mut self, py: Python<'p>) -> PyResult<&'p Py<PyTuple>> {
+        if self.values.is_none() {
+            let row = self.inner.take().expect("row already converted");
+            let tuple = PyTuple::new(py, row.into_iter().map(Value))?;
+            self.values = Some(tuple.unbind());
+        }
+        Ok(self.values.as_ref().unwrap())
     }
 }
 
 #[pymethods]
 impl Row {
-    pub fn values<'p>(&'p self, py: Python<'p>) -> PyResult<Bound<'p, PyTuple>> {
-        let vals = self.inner.values().iter().map(|v| Value(v.clone()));
-        let tuple = PyTuple::new(py, vals)?;
-        Ok(tuple)
+    pub fn values<'p>(&'p mut self, py: Python<'p>) -> PyResult<Bound<'p, PyTuple>> {
+        Ok(self.tuple(py)?.bind(py).clone())
     }
 
     pub fn __len__(&self) -> usize {
-        self.inner.len()
+        self.schema.fields().len()
     }
 
     pub fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
         slf
     }
-    pub fn __next__(&mut self) -> PyResult<Value> {
-        if self.idx >= self.inner.len() {
+    pub fn __next__(&mut self, py: Python) -> PyResult<PyObject> {
+        if self.idx >= self.schema.fields().len() {
             return Err(PyStopIteration::new_err("Columns exhausted"));
         }
-        let val = self.get_by_index(self.idx)?;
+        let val = self.get_by_index(py, self.idx)?;
         self.idx += 1;
         Ok(val)
     }
 
-    pub fn __dict__<'p>(&'p self, py: Python<'p>) -> PyResult<Bound<'p, PyDict>> {
+    pub fn __dict__<'p>(&'p mut self, py: Python<'p>) -> PyResult<Bound<'p, PyDict>> {
+        let schema = self.schema.clone();
+        let values = self.tuple(py)?.bind(py).clone();
         let dict = PyDict::new(py);
-        let schema = self.inner.schema();
-        for (field, value) in schema.fields().iter().zip(self.inner.values()) {
-            dict.set_item(&field.name, Value(value.clone()))?;
+        for (field, value) in schema.fields().iter().zip(values.iter()) {
+            dict.set_item(&field.name, value)?;
         }
         Ok(dict.into_bound())
     }
 
-    fn get_by_index(&self, idx: usize) -> PyResult<Value> {
-        Ok(Value(self.inner.values()[idx].clone()))
+    fn get_by_index(&mut self, py: Python, idx: usize) -> PyResult<PyObject> {
+        Ok(self.tuple(py)?.bind(py).get_item(idx)?.unbind())
     }
 
-    fn get_by_field(&self, field: &str) -> PyResult<Value> {
-        let schema = self.inner.schema();
-        let idx = schema
+    fn get_by_field(&mut self, py: Python, field: &str) -> PyResult<PyObject> {
+        let idx = self
+            .schema
             .fields()
             .iter()
             .position(|f| f.name == field)
             .ok_or_else(|| PyException::new_err(format!("field '{field}' not found in schema")))?;
-        Ok(Value(self.inner.values()[idx].clone()))
+        self.get_by_index(py, idx)
     }
 
-    pub fn __getitem__<'p>(&'p self, key: Bound<'p, PyAny>) -> PyResult<Value> {
+    pub fn __getitem__<'p>(
+        &'p mut self,
+        py: Python<'p>,
+        key: Bound<'p, PyAny>,
+    ) -> PyResult<PyObject> {
         if let Ok(idx) = key.extract::<usize>() {
-            self.get_by_index(idx)
+            self.get_by_index(py, idx)
         } else if let Ok(field) = key.extract::<String>() {
-            self.get_by_field(&field)
+            self.get_by_field(py, &field)
         } else {
             Err(PyAttributeError::new_err(
                 "key must be an integer or a string",
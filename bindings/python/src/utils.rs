@@ -87,6 +87,71 @@ fn py_to_json(v: Bound<PyAny>) -> PyResult<serde_json::Value> {
     )))
 }
 
+pub(crate) fn to_csv_strings(parameters: Vec<Bound<'_, PyAny>>) -> PyResult<Vec<Vec<String>>> {
+    let mut rows = Vec::with_capacity(parameters.len());
+    for row in parameters {
+        let iter = row.try_iter()?;
+        let row = iter
+            .map(|v| match v {
+                Ok(v) => to_csv_field(v),
+                Err(e) => Err(e),
+            })
+            .collect::<Result<Vec<_>, _>>()?;
+        rows.push(row);
+    }
+    Ok(rows)
+}
+
+fn to_csv_field(v: Bound<PyAny>) -> PyResult<String> {
+    if v.is_none() {
+        return Ok("".to_string());
+    }
+    match v.downcast::<PyAny>() {
+        Ok(v) => {
+            if let Ok(v) = v.extract::<String>() {
+                Ok(v)
+            } else if let Ok(v) = v.extract::<bool>() {
+                Ok(v.to_string())
+            } else if let Ok(v) = v.extract::<i64>() {
+                Ok(v.to_string())
+            } else if let Ok(v) = v.extract::<f64>() {
+                Ok(v.to_string())
+            } else {
+                // Try to convert dict-like objects to JSON string
+                if let Ok(dict) = v.downcast::<PyDict>() {
+                    // Convert Python dict to JSON string
+                    let json_string = Python::with_gil(|py| {
+                        let json_module = py.import("json")?;
+                        let dumps = json_module.getattr("dumps")?;
+                        let result = dumps.call1((dict,))?;
+                        result.extract::<String>()
+                    })?;
+                    Ok(json_string)
+                } else {
+                    // Try to convert any object to string using its __str__ method
+                    match v.call_method0("__str__") {
+                        Ok(str_obj) => {
+                            if let Ok(s) = str_obj.extract::<String>() {
+                                Ok(s)
+                            } else {
+                                Err(PyAttributeError::new_err(format!(
+                                    "Failed to convert object to string: {v:?}"
+                                )))
+                            }
+                        }
+                        Err(_) => {
+                            Err(PyAttributeError::new_err(format!(
+                                "Invalid parameter type for: {v:?}, expected str, bool, int, float, dict, or object with __str__ method"
+                            )))
+                        }
+                    }
+                }
+            }
+        }
+        Err(e) => Err(e.into()),
+    }
+}
+
 pub(super) fn options_as_ref(
     format_options: &Option<BTreeMap<String, String>>,
 ) -> Option<BTreeMap<&str, &str>> {
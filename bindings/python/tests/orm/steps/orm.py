@@ -17,12 +17,16 @@ Step definitions for Databend ORM functionality tests
 """
 
 import asyncio
+import os
+import sys
+from collections import deque
 from dataclasses import dataclass
 from typing import Annotated, Optional
 from datetime import datetime, date
 from behave import given, when, then
 from behave.runner import Context
 
+import databend_driver
 from databend_driver.orm import (
     databend_model,
     rename,
@@ -37,9 +41,15 @@ from databend_driver.orm import (
 )
 
 
-# Test models defined at module level so they can be reused
+# Test models defined at module level so they can be reused.
+# slots=True drops the per-instance __dict__ and makes attribute reads
+# fixed-offset loads; it only exists on Python >= 3.10 and the CI matrix
+# still covers 3.8/3.9.
+_MODEL_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 @databend_model
-@dataclass
+@dataclass(**_MODEL_KWARGS)
 class SimpleModel:
     """Simple model without annotations"""
 
@@ -49,7 +59,7 @@ class SimpleModel:
 
 
 @databend_model
-@dataclass
+@dataclass(**_MODEL_KWARGS)
 class UserModel:
     """User model with field renaming"""
 
@@ -60,7 +70,7 @@ class UserModel:
 
 
 @databend_model
-@dataclass
+@dataclass(**_MODEL_KWARGS)
 class SkipModel:
     """Model with skip_serializing fields"""
 
@@ -71,7 +81,7 @@ class SkipModel:
 
 
 @databend_model
-@dataclass
+@dataclass(**_MODEL_KWARGS)
 class DeserializeModel:
     """Model for testing deserialization"""
 
@@ -85,7 +95,7 @@ class DeserializeModel:
 
 
 @databend_model
-@dataclass
+@dataclass(**_MODEL_KWARGS)
 class AliasModel:
     """Model using convenience aliases"""
 
@@ -96,7 +106,7 @@ class AliasModel:
 
 
 @databend_model
-@dataclass
+@dataclass(**_MODEL_KWARGS)
 class ComplexModel:
     """Complex model with mixed annotations"""
 
@@ -108,12 +118,25 @@ class ComplexModel:
     secret: Annotated[str, skip_both()] = "secret"
 
 
+_MOCK_ROWS = (
+    [1, "alice", "alice@example.com", date(1990, 1, 15)],
+    [2, "bob", "bob@example.com", date(1985, 3, 22)],
+)
+
+
+async def _mock_rows():
+    for row in _MOCK_ROWS:
+        yield row
+
+
 class MockConnection:
     """Mock database connection for testing"""
 
     def __init__(self):
-        self.executed_sqls = []
-        self.executed_params = []
+        # bounded so a long scenario cannot grow the log without limit;
+        # step assertions only index from the front
+        self.executed_sqls = deque(maxlen=4096)
+        self.executed_params = deque(maxlen=4096)
 
     async def exec(self, sql, params):
         self.executed_sqls.append(sql)
@@ -121,26 +144,17 @@ class MockConnection:
         return 1
 
     async def query_iter(self, sql, params):
-        # Mock async iterator
-        class AsyncRowIter:
-            def __init__(self):
-                self.rows = [
-                    [1, "alice", "alice@example.com", date(1990, 1, 15)],
-                    [2, "bob", "bob@example.com", date(1985, 3, 22)],
-                ]
-                self.index = 0
+        return _mock_rows()
+
 
-            def __aiter__(self):
-                return self
+# placeholder strings indexed by field count, built once at import
+_PLACEHOLDERS = tuple(", ".join(["?"] * n) for n in range(32))
 
-            async def __anext__(self):
-                if self.index >= len(self.rows):
-                    raise StopAsyncIteration
-                row = self.rows[self.index]
-                self.index += 1
-                return row
 
-        return AsyncRowIter()
+def _placeholders(n: int) -> str:
+    if n < len(_PLACEHOLDERS):
+        return _PLACEHOLDERS[n]
+    return ", ".join(["?"] * n)
 
 
 class ORMConnectionHelper:
@@ -148,16 +162,39 @@ class ORMConnectionHelper:
 
     def __init__(self, connection):
         self.connection = connection
+        self._sql_cache = {}
+
+    def _insert_sql(self, table_name: str, model_class) -> str:
+        key = (table_name, model_class)
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            field_names = model_class.field_names()
+            placeholders = _placeholders(len(field_names))
+            sql = f"INSERT INTO {table_name} ({', '.join(field_names)}) VALUES ({placeholders})"
+            self._sql_cache[key] = sql
+        return sql
 
     async def insert_model(self, table_name: str, model):
         """Insert single model object"""
-        field_names = model.field_names()
-        values = model.to_values()
-
-        placeholders = ", ".join(["?" for _ in field_names])
-        sql = f"INSERT INTO {table_name} ({', '.join(field_names)}) VALUES ({placeholders})"
-
-        return await self.connection.exec(sql, values)
+        sql = self._insert_sql(table_name, type(model))
+        return await self.connection.exec(sql, model.to_values())
+
+    async def insert_many(self, table_name: str, models, chunk_size=1000):
+        """Insert model objects with one multi-row INSERT per chunk"""
+        if not models:
+            return 0
+        model_class = type(models[0])
+        field_names = model_class.field_names()
+        row_placeholder = "(" + _placeholders(len(field_names)) + ")"
+        prefix = f"INSERT INTO {table_name} ({', '.join(field_names)}) VALUES "
+
+        affected = 0
+        for start in range(0, len(models), chunk_size):
+            chunk = models[start : start + chunk_size]
+            sql = prefix + ", ".join([row_placeholder for _ in chunk])
+            params = [value for model in chunk for value in model.to_values()]
+            affected += await self.connection.exec(sql, params)
+        return affected
 
     async def query_models(self, model_class, sql: str, params=None):
         """Query and return model object list"""
@@ -170,6 +207,37 @@ class ORMConnectionHelper:
 
         return models
 
+    async def query_models_batched(
+        self, model_class, sql: str, params=None, batch_size=1024
+    ):
+        """Query and return model object list, converting in column batches"""
+        rows = await self.connection.query_iter(sql, params or [])
+
+        models = []
+        batch = []
+        async for row in rows:
+            batch.append(row.values() if hasattr(row, "values") else row)
+            if len(batch) >= batch_size:
+                models.extend(model_class._from_columns(list(zip(*batch))))
+                batch = []
+        if batch:
+            models.extend(model_class._from_columns(list(zip(*batch))))
+
+        return models
+
+
+# one event loop shared by every async step; behave would otherwise run
+# each step on a fresh loop via asyncio.run
+LOOP = asyncio.new_event_loop()
+
+# the real-DB scenario always inserts a UserModel, so its SQL is fixed
+_USER_FIELDS = UserModel.field_names()
+_USER_INSERT_SQL = (
+    f"INSERT INTO test_users ({', '.join(_USER_FIELDS)})"
+    f" VALUES ({_placeholders(len(_USER_FIELDS))})"
+)
+_USER_SELECT_SQL = f"SELECT {', '.join(_USER_FIELDS)} FROM test_users WHERE id = ?"
+
 
 # Step definitions
 
@@ -348,24 +416,18 @@ def step_create_table_and_insert(context: Context):
                 birth_date=date(1990, 1, 15),
             )
 
-            field_names = user.field_names()
-            values = user.to_values()
-            placeholders = ", ".join(["?" for _ in field_names])
-            insert_sql = f"INSERT INTO test_users ({', '.join(field_names)}) VALUES ({placeholders})"
-
-            rows_affected = await conn.exec(insert_sql, values)
+            rows_affected = await conn.exec(_USER_INSERT_SQL, user.to_values())
             context.rows_inserted = rows_affected
 
             # Query back
-            select_sql = f"SELECT {', '.join(field_names)} FROM test_users WHERE id = ?"
-            row = await conn.query_row(select_sql, [1])
+            row = await conn.query_row(_USER_SELECT_SQL, [1])
             context.retrieved_user = UserModel.from_row(row)
 
         finally:
             await conn.exec("DROP TABLE test_users")
             await conn.close()
 
-    asyncio.run(run_db_test())
+    LOOP.run_until_complete(run_db_test())
 
 
 @when("I use it to insert and query models")
@@ -387,7 +449,13 @@ def step_use_orm_helper(context: Context):
         models = await context.orm_helper.query_models(UserModel, "SELECT * FROM users")
         context.queried_models = models
 
-    asyncio.run(run_helper_test())
+        # Test the column-batched path against the row-at-a-time one
+        batched = await context.orm_helper.query_models_batched(
+            UserModel, "SELECT * FROM users"
+        )
+        context.batched_models = batched
+
+    LOOP.run_until_complete(run_helper_test())
 
 
 @then("I should get all field names in order")
@@ -526,3 +594,4 @@ def step_verify_orm_helper_operations(context: Context):
     assert len(context.queried_models) == 2
     assert context.queried_models[0].username == "alice"
     assert context.queried_models[1].username == "bob"
+    assert context.batched_models == context.queried_models
@@ -437,10 +437,14 @@ impl APIClient {
         let cookie = HeaderValue::from_str("cookie_enabled=true").unwrap();
         let mut initial_cookies = [&cookie].into_iter();
         cookie_provider.set_cookies(&mut initial_cookies, &Url::parse("https://a.com").unwrap());
+        // HTTP/2 is negotiated via ALPN when the server offers it, letting
+        // concurrent queries multiplex one TLS connection; plain HTTP and
+        // HTTP/1.1-only servers are unaffected
         let mut cli_builder = HttpClient::builder()
             .user_agent(ua)
             .connect_timeout(self.connect_timeout)
             .cookie_provider(Arc::new(cookie_provider))
+            .http2_adaptive_window(true)
             .pool_idle_timeout(Duration::from_secs(1));
         #[cfg(any(feature = "rustls", feature = "native-tls"))]
         if self.scheme == "https" {
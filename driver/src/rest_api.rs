@@ -276,7 +276,8 @@ impl IConnection for RestAPIConnection {
         let file = File::open(fp).await?;
         let metadata = file.metadata().await?;
         let size = metadata.len();
-        let data = BufReader::new(file);
+        // 64 KiB reads keep syscall count low without buffering the whole file
+        let data = BufReader::with_capacity(64 * 1024, file);
         self.load_data(sql, Box::new(data), size, method).await
     }
 
@@ -290,7 +291,7 @@ impl IConnection for RestAPIConnection {
         let file = File::open(fp).await?;
         let metadata = file.metadata().await?;
         let size = metadata.len();
-        let data = BufReader::new(file);
+        let data = BufReader::with_capacity(64 * 1024, file);
         self.load_data_with_options(sql, Box::new(data), size, file_format_options, copy_options)
             .await
     }
@@ -302,7 +303,13 @@ impl IConnection for RestAPIConnection {
         method: LoadMethod,
     ) -> Result<ServerStats> {
         info!("stream load: {}; rows: {:?}", sql, data.len());
-        let mut wtr = csv::WriterBuilder::new().from_writer(vec![]);
+        // reserve room for every cell plus delimiters/quotes up front so the
+        // encoder never regrows the buffer mid-load
+        let cap = data
+            .iter()
+            .map(|row| row.iter().map(|cell| cell.len() + 3).sum::<usize>() + 1)
+            .sum();
+        let mut wtr = csv::WriterBuilder::new().from_writer(Vec::with_capacity(cap));
         for row in data {
             wtr.write_record(row)
                 .map_err(|e| Error::BadArgument(e.to_string()))?;
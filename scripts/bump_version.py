@@ -20,6 +20,7 @@ import pathlib
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
@@ -27,6 +28,11 @@ CARGO_TOML = ROOT / "Cargo.toml"
 NODE_PACKAGE = ROOT / "bindings" / "nodejs" / "package.json"
 NODE_NPM_DIR = ROOT / "bindings" / "nodejs" / "npm"
 
+WORKSPACE_VERSION_RE = re.compile(
+    r'(?ms)^(\[workspace\.package\].*?^version\s*=\s*")([^"]+)(")'
+)
+DEP_VERSION_RE = re.compile(r'(?m)^(databend-\S+.*?version\s*=\s*)"[^"]+"')
+
 
 def ensure_clean_git_state() -> None:
     result = subprocess.run(
@@ -42,22 +48,20 @@ def ensure_clean_git_state() -> None:
         )
 
 
-def read_current_version() -> tuple[str, list[str], int]:
-    lines = CARGO_TOML.read_text().splitlines()
-    in_workspace_pkg = False
-    for idx, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped.startswith("[") and stripped != "[workspace.package]":
-            in_workspace_pkg = False
-        if stripped == "[workspace.package]":
-            in_workspace_pkg = True
-            continue
-        if in_workspace_pkg and stripped.startswith("version"):
-            match = re.search(r'"([^"]+)"', line)
-            if not match:
-                break
-            return match.group(1), lines, idx
-    raise SystemExit("Unable to find workspace package version in Cargo.toml")
+def bump_cargo_version(bump: str) -> tuple[str, str]:
+    """Rewrite Cargo.toml in one read/write pass; returns (old, new) version."""
+    text = CARGO_TOML.read_text()
+    match = WORKSPACE_VERSION_RE.search(text)
+    if not match:
+        raise SystemExit("Unable to find workspace package version in Cargo.toml")
+    current_version = match.group(2)
+    new_version = compute_new_version(current_version, bump)
+    text = WORKSPACE_VERSION_RE.sub(
+        lambda m: f"{m.group(1)}{new_version}{m.group(3)}", text, count=1
+    )
+    text = DEP_VERSION_RE.sub(lambda m: f'{m.group(1)}"{new_version}"', text)
+    CARGO_TOML.write_text(text)
+    return current_version, new_version
 
 
 def compute_new_version(version: str, bump: str) -> str:
@@ -79,18 +83,6 @@ def compute_new_version(version: str, bump: str) -> str:
     return f"{major}.{minor}.{patch}"
 
 
-def update_cargo_toml(lines: list[str], version_index: int, new_version: str) -> None:
-    target_line = lines[version_index]
-    lines[version_index] = re.sub(r'"[^"]+"', f'"{new_version}"', target_line, count=1)
-    for idx, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped.startswith("databend-") and "version" in line:
-            lines[idx] = re.sub(
-                r'version\s*=\s*"[^"]+"', f'version = "{new_version}"', line, count=1
-            )
-    CARGO_TOML.write_text("\n".join(lines) + "\n")
-
-
 def update_package_json(path: pathlib.Path, new_version: str) -> None:
     data = json.loads(path.read_text())
     data["version"] = new_version
@@ -98,11 +90,10 @@ def update_package_json(path: pathlib.Path, new_version: str) -> None:
 
 
 def update_node_packages(new_version: str) -> list[pathlib.Path]:
-    updated = [NODE_PACKAGE]
-    update_package_json(NODE_PACKAGE, new_version)
-    for package_json in sorted(NODE_NPM_DIR.glob("*/package.json")):
-        update_package_json(package_json, new_version)
-        updated.append(package_json)
+    updated = [NODE_PACKAGE, *sorted(NODE_NPM_DIR.glob("*/package.json"))]
+    # each rewrite is independent read-parse-write I/O, so overlap them
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda path: update_package_json(path, new_version), updated))
     return updated
 
 
@@ -128,9 +119,7 @@ def main() -> None:
     args = parser.parse_args()
 
     ensure_clean_git_state()
-    current_version, lines, version_index = read_current_version()
-    new_version = compute_new_version(current_version, args.bump)
-    update_cargo_toml(lines, version_index, new_version)
+    current_version, new_version = bump_cargo_version(args.bump)
     updated_json = update_node_packages(new_version)
     create_commit(new_version, updated_json)
     print(f"Bumped version: {current_version} -> {new_version}")
@@ -15,6 +15,9 @@
 import nox
 import os
 
+# uv creates venvs and installs much faster than pip; fall back when absent
+nox.options.default_venv_backend = "uv|virtualenv"
+
 
 def generate_params1():
     for db_version in ["1.2.803", "1.2.791"]:
@@ -25,8 +28,11 @@ def generate_params1():
             yield nox.param(db_version, query_result_format)
 
 
+PARAMS1 = tuple(generate_params1())
+
+
 @nox.session
-@nox.parametrize(["db_version", "query_result_format"], generate_params1())
+@nox.parametrize(["db_version", "query_result_format"], PARAMS1)
 def new_driver_with_old_servers(session, db_version, query_result_format):
     query_version = f"v{db_version}-nightly"
     session.install("behave")
@@ -57,8 +63,11 @@ def generate_params2():
             yield nox.param(driver_version, query_result_format)
 
 
+PARAMS2 = tuple(generate_params2())
+
+
 @nox.session
-@nox.parametrize(["driver_version", "query_result_format"], generate_params2())
+@nox.parametrize(["driver_version", "query_result_format"], PARAMS2)
 def new_test_with_old_drivers(session, driver_version, query_result_format):
     session.install("behave")
     session.install(f"databend-driver=={driver_version}")